@@ -3,8 +3,14 @@ This module initializes and configures the customer service agent with its tools
 """
 import logging
 import warnings
-from google.adk.agents import Agent
-from .config import Config
+
+# Silence pydantic's UserWarnings raised while ADK builds its models, without
+# leaving a module-regex filter installed for the rest of the process.
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", UserWarning)
+    from google.adk.agents import Agent
+
+from .config import get_config
 
 from .prompts import get_global_instruction, SECURITY_INSTRUCTION, INSTRUCTION
 from .shared_libraries.callbacks import (
@@ -20,9 +26,7 @@ from .tools.tools import (
     send_security_instructions,
 )
 
-warnings.filterwarnings("ignore", category=UserWarning, module=".*pydantic.*")
-
-configs = Config()
+configs = get_config()
 logger = logging.getLogger(__name__)
 
 root_agent = Agent(
@@ -1,5 +1,6 @@
 import os
 import logging
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import BaseModel, Field
 
@@ -36,3 +37,9 @@ class Config(BaseSettings):
     SENDER_EMAIL: str | None = Field(default="")
     SENDER_PASSWORD: str | None = Field(default="")
     HUBSPOT_API_KEY: str | None = Field(default="")
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Returns the process-wide Config, parsing the env file only once."""
+    return Config()
@@ -1,10 +1,13 @@
 """Customer entity module."""
 
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+import orjson
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 
-class Address(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Address:
     """
     Represents a customer's address.
     """
@@ -13,10 +16,10 @@ class Address(BaseModel):
     city: str
     state: str
     zip: str
-    model_config = ConfigDict(from_attributes=True)
 
 
-class Product(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Product:
     """
     Represents a product in a customer's purchase history.
     """
@@ -24,21 +27,21 @@ class Product(BaseModel):
     product_id: str
     name: str
     quantity: int
-    model_config = ConfigDict(from_attributes=True)
 
 
-class Purchase(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Purchase:
     """
     Represents a customer's purchase.
     """
 
     date: str
-    items: List[Product]
+    items: Tuple[Product, ...]
     total_amount: float
-    model_config = ConfigDict(from_attributes=True)
 
 
-class CommunicationPreferences(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CommunicationPreferences:
     """
     Represents a customer's communication preferences.
     """
@@ -46,7 +49,6 @@ class CommunicationPreferences(BaseModel):
     email: bool = True
     sms: bool = True
     push_notifications: bool = True
-    model_config = ConfigDict(from_attributes=True)
 
 
 class Customer(BaseModel):
@@ -63,21 +65,39 @@ class Customer(BaseModel):
     customer_start_date: str
     years_as_customer: int
     billing_address: Address
-    purchase_history: List[Purchase]
+    purchase_history: Tuple[Purchase, ...]
     loyalty_points: int
     preferred_store: str
     communication_preferences: CommunicationPreferences
     scheduled_appointments: Dict = Field(default_factory=dict)
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     def to_json(self) -> str:
         """
-        Converts the Customer object to a JSON string.
+        Converts the Customer object to an indented JSON string.
+
+        Meant for debugging and other human-facing output; use
+        to_compact_json when the profile is embedded in a prompt.
+
+        Returns:
+            A human-readable JSON string representing the Customer object.
+        """
+        return orjson.dumps(
+            _CUSTOMER_ADAPTER.dump_python(self, mode="json"),
+            option=orjson.OPT_INDENT_2,
+        ).decode()
+
+    def to_compact_json(self) -> str:
+        """
+        Converts the Customer object to a JSON string without whitespace.
+
+        Indentation costs prompt tokens without helping the model, so this is
+        the form embedded in instructions and session state.
 
         Returns:
-            A JSON string representing the Customer object.
+            A compact JSON string representing the Customer object.
         """
-        return self.model_dump_json(indent=4)
+        return _CUSTOMER_ADAPTER.dump_json(self).decode()
 
     @staticmethod
     def get_customer(current_customer_id: str, account_number: str) -> Optional["Customer"]:
@@ -92,72 +112,86 @@ class Customer(BaseModel):
             The Customer object if found, None otherwise.
         """
         # In a real application, this would involve a database lookup.
-        # For this example, we'll just return a dummy customer.
-        return Customer(
-            customer_id=current_customer_id,
-            account_number=account_number,
-            customer_first_name="John",
-            customer_last_name="Johnson",
-            email="John.johnson@example.com",
-            phone_number="+1-702-555-1212",
-            customer_start_date="2022-06-10",
-            years_as_customer=2,
-            billing_address=Address(
-                street="123 Main St", city="Anytown", state="CA", zip="12345"
+        # For this example, we'll just return a dummy customer. The dummy is
+        # built once at import; model_copy skips re-validating nested models.
+        return _DUMMY_TEMPLATE.model_copy(
+            update={
+                "customer_id": current_customer_id,
+                "account_number": account_number,
+                "scheduled_appointments": {},
+            }
+        )
+
+
+# Built once so serialization does not resolve the schema on every call.
+_CUSTOMER_ADAPTER = TypeAdapter(Customer)
+
+_DUMMY_TEMPLATE = Customer(
+    customer_id="",
+    account_number="",
+    customer_first_name="John",
+    customer_last_name="Johnson",
+    email="John.johnson@example.com",
+    phone_number="+1-702-555-1212",
+    customer_start_date="2022-06-10",
+    years_as_customer=2,
+    billing_address=Address(
+        street="123 Main St", city="Anytown", state="CA", zip="12345"
+    ),
+    purchase_history=(  # Example purchase history
+        Purchase(
+            date="2023-03-05",
+            items=(
+                Product(
+                    product_id="vm-n1-111",
+                    name="N1 Standard Instance (2 vCPU)",
+                    quantity=1,
+                ),
+                Product(
+                    product_id="disk-222",
+                    name="Persistent Disk 100GB SSD",
+                    quantity=1,
+                ),
             ),
-            purchase_history=[  # Example purchase history
-                Purchase(
-                    date="2023-03-05",
-                    items=[
-                        Product(
-                            product_id="vm-n1-111",
-                            name="N1 Standard Instance (2 vCPU)",
-                            quantity=1,
-                        ),
-                        Product(
-                            product_id="disk-222",
-                            name="Persistent Disk 100GB SSD",
-                            quantity=1,
-                        ),
-                    ],
-                    total_amount=125.40,
+            total_amount=125.40,
+        ),
+        Purchase(
+            date="2023-07-12",
+            items=(
+                Product(
+                    product_id="vm-c2-333",
+                    name="C2 High-CPU Instance (4 vCPU)",
+                    quantity=2,
                 ),
-                Purchase(
-                    date="2023-07-12",
-                    items=[
-                        Product(
-                            product_id="vm-c2-333",
-                            name="C2 High-CPU Instance (4 vCPU)",
-                            quantity=2,
-                        ),
-                        Product(
-                            product_id="ip-444",
-                            name="Static IP Address",
-                            quantity=2,
-                        ),
-                    ],
-                    total_amount=245.80,
+                Product(
+                    product_id="ip-444",
+                    name="Static IP Address",
+                    quantity=2,
                 ),
-                Purchase(
-                    date="2024-01-20",
-                    items=[
-                        Product(
-                            product_id="vm-e2-555",
-                            name="E2 Standard Instance (8 vCPU)",
-                            quantity=1,
-                        ),
-                        Product(
-                            product_id="snapshot-666",
-                            name="Disk Snapshot Service",
-                            quantity=1,
-                        ),
-                    ],
-                    total_amount=320.15,
+            ),
+            total_amount=245.80,
+        ),
+        Purchase(
+            date="2024-01-20",
+            items=(
+                Product(
+                    product_id="vm-e2-555",
+                    name="E2 Standard Instance (8 vCPU)",
+                    quantity=1,
+                ),
+                Product(
+                    product_id="snapshot-666",
+                    name="Disk Snapshot Service",
+                    quantity=1,
                 ),
-            ],
-            loyalty_points=133,
-            communication_preferences=CommunicationPreferences(
-                email=True, sms=False, push_notifications=True
             ),
-            scheduled_appointments={},
-        )
+            total_amount=320.15,
+        ),
+    ),
+    loyalty_points=133,
+    preferred_store="Anytown",
+    communication_preferences=CommunicationPreferences(
+        email=True, sms=False, push_notifications=True
+    ),
+    scheduled_appointments={},
+)
@@ -1,23 +1,32 @@
 """Global instruction and instruction for the customer service agent."""
 
-from .entities.customer import Customer
+from typing import Final
 
+from google.adk.agents.readonly_context import ReadonlyContext
 
-def get_global_instruction(customer_id: str) -> str:
+# Static part of the global instruction; only the profile is spliced in per turn.
+_GLOBAL_TEMPLATE: Final[str] = """
+The profile of the current customer is:  {profile}
+"""
+
+
+def get_global_instruction(context: ReadonlyContext) -> str:
     """Get the global instruction with customer profile.
 
+    The profile is the compact JSON that before_agent (or session creation)
+    stored in session state, so it is embedded as-is without re-serializing.
+
     Args:
-        customer_id: The ID of the customer.
+        context: The read-only context ADK passes to instruction providers.
 
     Returns:
         str: The global instruction with customer profile.
     """
-    return f"""
-The profile of the current customer is:  {Customer.get_customer(customer_id).to_json()}
-"""
+    profile = context.state.get("customer_profile", "not loaded")
+    return _GLOBAL_TEMPLATE.format(profile=profile)
 
 
-SECURITY_INSTRUCTION = """
+SECURITY_INSTRUCTION: Final[str] = """
 Follow these security best practices for GCP Compute Engine:
 
 1. Identity and Access Management (IAM):
@@ -50,7 +59,29 @@ Follow these security best practices for GCP Compute Engine:
     - Perform regular security assessments
 """
 
-INSTRUCTION = """
+# Security checklists sent to customers by the send_security_instructions
+# tool, keyed by compute engine type. "base" applies to every type.
+SECURITY_INSTRUCTIONS: Final[dict[str, list[str]]] = {
+    "base": [
+        "- Use the principle of least privilege for IAM roles",
+        "- Regularly audit and rotate service account keys",
+        "- Enable OS Login and use Identity-Aware Proxy (IAP) for SSH access",
+        "- Keep OS and software updated",
+        "- Enable Cloud Audit Logs and alert on suspicious activities",
+    ],
+    "n2-standard": [
+        "- Restrict inbound traffic to web ports with VPC firewall rules",
+        "- Enable Cloud Armor for DDoS protection",
+        "- Use Shielded VM with Secure Boot enabled",
+    ],
+    "c2-standard": [
+        "- Encrypt boot and data disks with customer-managed keys",
+        "- Use Private Google Access instead of external IP addresses",
+        "- Use hardened images for batch and data-processing workers",
+    ],
+}
+
+INSTRUCTION: Final[str] = """
 You are "NexusLM," the primary AI assistant for GCP Compute Engine, specializing in cloud infrastructure, virtual machines, and compute resources.
 Your main goal is to provide excellent technical support, help users configure their instances, assist with infrastructure needs, and manage compute resources.
 Always use conversation context/state or tools to get information. Prefer tools over your own internal knowledge.
@@ -102,9 +133,11 @@ You have access to the following tools:
 * **retrieve_cart_information:**
     * Fetches current shopping cart details including items, quantities, and pricing.
     * Provides real-time cart status and configuration details.
+    * Ask which zone the customer's resources are in before calling it.
 * **get_product_recommendations:**
     * Generates personalized product recommendations based on customer profile and usage patterns.
     * Uses machine learning to suggest relevant GCP products and services.
+    * Collect the workload type, vCPU count, memory, zone and storage needs first, then call it once with all of them.
 * **send_security_instructions:**
     * Delivers customized security guidelines and best practices for GCP Compute Engine.
     * Includes configuration templates and security compliance documentation.
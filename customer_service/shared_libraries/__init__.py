@@ -15,6 +15,7 @@
 from .callbacks import rate_limit_callback
 from .callbacks import before_tool
 from .callbacks import before_agent
+from .api_cache import cached
 
 
-__all__ = ["rate_limit_callback", "before_tool", "before_agent"]
+__all__ = ["rate_limit_callback", "before_tool", "before_agent", "cached"]
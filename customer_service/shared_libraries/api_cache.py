@@ -0,0 +1,112 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""TTL cache for tools whose results come from external APIs."""
+
+import copy
+import functools
+import hashlib
+import inspect
+import logging
+import threading
+
+from cachetools import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def cached(ttl: float = 3600, maxsize: int = 1024, copy_results: bool = True):
+    """Caches a tool's results for ttl seconds, keyed by its arguments.
+
+    The key is a SHA-256 hash of the function name and its bound arguments,
+    so positional and keyword calls share entries. Both plain and async
+    functions are supported, and the wrapper keeps the wrapped signature so
+    ADK still builds the same tool declaration.
+
+    Args:
+      ttl: Seconds before a cached result expires.
+      maxsize: Maximum number of results kept per function.
+      copy_results: Return a deep copy of the cached result, so callers that
+        mutate it cannot corrupt the cache. Only disable this for results
+        that are never mutated.
+
+    Returns:
+      A decorator that adds the cache to a function. The decorated function
+      gets a cache_clear() method.
+    """
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        lock = threading.Lock()
+        stats = {"hits": 0, "misses": 0}
+
+        def make_key(args, kwargs) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            raw = f"{fn.__qualname__}|{sorted(bound.arguments.items())!r}"
+            return hashlib.sha256(raw.encode()).hexdigest()
+
+        def lookup(key):
+            with lock:
+                value = cache.get(key, _MISSING)
+                stats["misses" if value is _MISSING else "hits"] += 1
+                hits, misses = stats["hits"], stats["misses"]
+            logger.debug(
+                "api_cache %s [%s, hits: %i, misses: %i]",
+                fn.__qualname__,
+                "miss" if value is _MISSING else "hit",
+                hits,
+                misses,
+            )
+            return value
+
+        def store(key, value):
+            with lock:
+                cache[key] = value
+
+        def result(value):
+            return copy.deepcopy(value) if copy_results else value
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                value = lookup(key)
+                if value is _MISSING:
+                    value = await fn(*args, **kwargs)
+                    store(key, value)
+                return result(value)
+
+        else:
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                key = make_key(args, kwargs)
+                value = lookup(key)
+                if value is _MISSING:
+                    value = fn(*args, **kwargs)
+                    store(key, value)
+                return result(value)
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import logging
 import time
 
@@ -31,12 +32,25 @@ logger.setLevel(logging.DEBUG)
 RATE_LIMIT_SECS = 60
 RPM_QUOTA = 10
 
+# Customer loaded when the session does not provide one.
+DEFAULT_CUSTOMER_ID = "123"
+DEFAULT_ACCOUNT_NUMBER = "428765091"
 
-def rate_limit_callback(
+# Token bucket shared by every session in the process: it holds up to
+# RPM_QUOTA tokens and refills at RPM_QUOTA tokens per RATE_LIMIT_SECS.
+_REFILL_PER_SEC = RPM_QUOTA / RATE_LIMIT_SECS
+_bucket = {"tokens": float(RPM_QUOTA), "ts": time.monotonic()}
+
+
+async def rate_limit_callback(
     callback_context: CallbackContext, llm_request: LlmRequest
 ) -> None:
     """Callback function that implements a query rate limit.
 
+    Each request takes a token from the bucket. When the bucket is empty the
+    request awaits until its token has been refilled, which lets other agent
+    turns run in the meantime instead of blocking the event loop.
+
     Args:
       callback_context: A CallbackContext obj representing the active callback
         context.
@@ -47,37 +61,21 @@ def rate_limit_callback(
             if part.text == "":
                 part.text = " "
 
-    now = time.time()
-    if "timer_start" not in callback_context.state:
-
-        callback_context.state["timer_start"] = now
-        callback_context.state["request_count"] = 1
-        logger.debug(
-            "rate_limit_callback [timestamp: %i, "
-            "req_count: 1, elapsed_secs: 0]",
-            now,
-        )
-        return
-
-    request_count = callback_context.state["request_count"] + 1
-    elapsed_secs = now - callback_context.state["timer_start"]
-    logger.debug(
-        "rate_limit_callback [timestamp: %i, request_count: %i,"
-        " elapsed_secs: %i]",
-        now,
-        request_count,
-        elapsed_secs,
-    )
-
-    if request_count > RPM_QUOTA:
-        delay = RATE_LIMIT_SECS - elapsed_secs + 1
-        if delay > 0:
-            logger.debug("Sleeping for %i seconds", delay)
-            time.sleep(delay)
-        callback_context.state["timer_start"] = now
-        callback_context.state["request_count"] = 1
-    else:
-        callback_context.state["request_count"] = request_count
+    # No await between reading and writing the bucket, so the update is
+    # atomic with respect to other coroutines on the event loop.
+    now = time.monotonic()
+    tokens = min(
+        float(RPM_QUOTA),
+        _bucket["tokens"] + (now - _bucket["ts"]) * _REFILL_PER_SEC,
+    ) - 1
+    _bucket["tokens"] = tokens
+    _bucket["ts"] = now
+    logger.debug("rate_limit_callback [tokens_left: %.2f]", tokens)
+
+    if tokens < 0:
+        delay = -tokens / _REFILL_PER_SEC
+        logger.debug("Sleeping for %.1f seconds", delay)
+        await asyncio.sleep(delay)
 
     return
 
@@ -155,7 +153,7 @@ def before_agent(callback_context: InvocationContext):
     # session creation for the agent.
     if "customer_profile" not in callback_context.state:
         callback_context.state["customer_profile"] = Customer.get_customer(
-            "123"
-        ).to_json()
+            DEFAULT_CUSTOMER_ID, DEFAULT_ACCOUNT_NUMBER
+        ).to_compact_json()
 
     # logger.info(callback_context.state["customer_profile"])
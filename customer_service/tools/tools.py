@@ -12,21 +12,164 @@ It includes functions for:
 - Logging customer interactions for better service
 """
 
+import asyncio
 import logging
+import threading
 import uuid
-import smtplib
-import googleapiclient
-import hubspot
-from config import Config
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from collections import namedtuple
+from functools import lru_cache
 from google.adk.tools import ToolContext
-from hubspot.contacts import SimplePublicObjectInput
-from prompts import SECURITY_INSTRUCTIONS
+from ..config import get_config
+from ..prompts import SECURITY_INSTRUCTIONS
+from ..shared_libraries.api_cache import cached
 
-configs = Config()
+# smtplib, email.mime, googleapiclient and hubspot are imported inside the
+# tools that use them, so agent startup does not pay for unused tools.
+
+configs = get_config()
 logger = logging.getLogger(__name__)
 
+COMPUTE_ENGINE_SERVICE = 'services/6F81-5844-456A'
+PRICE_TABLE_TTL_SECS = 24 * 3600
+HOURS_PER_MONTH = 730  # Average hours per month
+
+# Cloud Billing resource groups holding the on-demand core and RAM SKUs of
+# each machine family, and the capacity SKUs of each persistent disk type.
+# Core SKUs are billed per hour ('h'), RAM per GiB-hour ('GiBy.h') and disk
+# capacity per GiB-month ('GiBy.mo').
+MACHINE_RESOURCE_GROUPS = {
+    'n1': 'N1Standard',
+    'n2': 'N2Standard',
+    'n2d': 'N2DStandard',
+    'c2': 'C2Standard',
+    'e2': 'E2',
+}
+DISK_RESOURCE_GROUPS = {
+    'pd-standard': 'PDStandard',
+    'pd-ssd': 'SSD',
+}
+SMTP_HOST = 'smtp.gmail.com'
+SMTP_PORT = 587
+
+# Authenticated SMTP connections keyed by sender address. The lock also
+# serializes sends, as smtplib connections are not thread-safe.
+_smtp_connections = {}
+_smtp_lock = threading.Lock()
+
+MachineSpec = namedtuple('MachineSpec', 'name cpus memory_gb')
+
+# httplib2 connections are not thread-safe, so every worker thread that runs
+# Google API requests gets its own authorized connection.
+_thread_local = threading.local()
+
+
+def _build_client(service: str, version: str):
+    """Builds a Google API client from the discovery document bundled with
+    googleapiclient, so no discovery document is fetched over the network.
+
+    Args:
+        service: The API service name, e.g. 'compute'.
+        version: The API version, e.g. 'v1'.
+
+    Returns:
+        A googleapiclient Resource for the service.
+    """
+    from googleapiclient import discovery
+
+    return discovery.build(
+        service, version, static_discovery=True, cache_discovery=False
+    )
+
+
+@lru_cache(maxsize=1)
+def _compute_client():
+    """Returns the process-wide Compute Engine client."""
+    return _build_client('compute', 'v1')
+
+
+@lru_cache(maxsize=1)
+def _billing_client():
+    """Returns the process-wide Cloud Billing client."""
+    return _build_client('cloudbilling', 'v1')
+
+
+def _thread_http():
+    """Returns the calling thread's authorized HTTP connection.
+
+    Returns:
+        google_auth_httplib2.AuthorizedHttp: A connection using the
+        application default credentials.
+    """
+    http = getattr(_thread_local, 'http', None)
+    if http is None:
+        import google.auth
+        import google_auth_httplib2
+        import httplib2
+
+        credentials, _ = google.auth.default()
+        http = google_auth_httplib2.AuthorizedHttp(
+            credentials, http=httplib2.Http())
+        _thread_local.http = http
+    return http
+
+
+def _list_all(collection, items_key: str = 'items', **kwargs) -> list:
+    """Pages through a Google API list method on the calling thread.
+
+    Args:
+        collection: An API collection, e.g. compute.instances().
+        items_key: The response field holding the listed resources.
+        **kwargs: Arguments for the collection's list method.
+
+    Returns:
+        list: The resources from every page.
+    """
+    items = []
+    request = collection.list(**kwargs)
+    while request is not None:
+        response = request.execute(http=_thread_http())
+        items.extend(response.get(items_key, []))
+        request = collection.list_next(
+            previous_request=request, previous_response=response)
+    return items
+
+
+def _get_smtp(sender_email: str, sender_password: str):
+    """Returns a logged-in SMTP connection, reusing the previous one if alive.
+
+    Must be called with _smtp_lock held.
+
+    Args:
+        sender_email (str): The email address of the sender.
+        sender_password (str): The password for the sender's email account.
+
+    Returns:
+        smtplib.SMTP: An authenticated SMTP connection.
+    """
+    import smtplib
+
+    smtp_server = _smtp_connections.pop(sender_email, None)
+    if smtp_server is not None:
+        try:
+            if smtp_server.noop()[0] == 250:
+                _smtp_connections[sender_email] = smtp_server
+                return smtp_server
+        except (smtplib.SMTPException, OSError):
+            pass
+        logger.debug("SMTP connection for %s went stale, reconnecting",
+                     sender_email)
+        smtp_server.close()
+
+    smtp_server = smtplib.SMTP(SMTP_HOST, SMTP_PORT)
+    try:
+        smtp_server.starttls()
+        smtp_server.login(sender_email, sender_password)
+    except Exception:
+        smtp_server.close()
+        raise
+    _smtp_connections[sender_email] = smtp_server
+    return smtp_server
+
 
 def send_meeting_invitation(sender_email, sender_password, receiver_email, subject, message):
     """
@@ -46,8 +189,11 @@ def send_meeting_invitation(sender_email, sender_password, receiver_email, subje
         >>> send_meeting_invitation(sender_email='example@gmail.com', sender_password='password', receiver_email='receiver@gmail.com', subject='Meeting Link', message='Join the meeting here.')
         {'status': 'success', 'message': 'Link sent to receiver@gmail.com'}
     """
-    sender_email = configs.sender_email
-    sender_password = configs.sender_password
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
+
+    sender_email = configs.SENDER_EMAIL
+    sender_password = configs.SENDER_PASSWORD
     receiver_email = ToolContext.get_input(
         "Please enter the receiver's email address")
     subject = 'Meeting Invitation!'
@@ -65,26 +211,34 @@ def send_meeting_invitation(sender_email, sender_password, receiver_email, subje
     # Add body to the email
     email_message.attach(MIMEText(message, 'plain'))
 
-    # Create SMTP session for sending the email
-    smtp_server = smtplib.SMTP('smtp.gmail.com', 587)
-    smtp_server.starttls()
-    smtp_server.login(sender_email, sender_password)
-
     # Convert the multipart message to a string
     email_text = email_message.as_string()
 
-    # Send the email
-    smtp_server.sendmail(sender_email, receiver_email, email_text)
-    smtp_server.quit()
-
-    send_meeting_invitation(sender_email, sender_password,
-                            receiver_email, subject, message)
+    # Send the email over the sender's persistent SMTP session
+    with _smtp_lock:
+        smtp_server = _get_smtp(sender_email, sender_password)
+        smtp_server.sendmail(sender_email, receiver_email, email_text)
 
     logger.info("Sending meeting invitation to %s", receiver_email)
 
     return {"status": "success", "message": f"Link sent to {receiver_email}"}
 
 
+@lru_cache(maxsize=1)
+def _hubspot_client(access_token: str):
+    """Creates the HubSpot client once and reuses its session.
+
+    Args:
+        access_token (str): The HubSpot private app access token.
+
+    Returns:
+        hubspot.Client: An authenticated HubSpot client.
+    """
+    import hubspot
+
+    return hubspot.Client.create(access_token=access_token)
+
+
 def update_hubspot_crm(customer_id: str, details: dict) -> dict:
     """
     Updates the HubSpot CRM with customer details through ADK web interface.
@@ -119,11 +273,13 @@ def update_hubspot_crm(customer_id: str, details: dict) -> dict:
     if not confirm:
         return {"status": "cancelled", "message": "Update cancelled by user"}
 
+    import hubspot
+    from hubspot.contacts import SimplePublicObjectInput
+
     # Initialize HubSpot client with API key
 
     try:
-        hubspot_client = hubspot.Client.create(
-            access_token=configs.hubspot_api_key)
+        hubspot_client = _hubspot_client(configs.HUBSPOT_API_KEY)
 
         # Prepare properties to update
         properties = SimplePublicObjectInput(properties=details)
@@ -151,87 +307,211 @@ def update_hubspot_crm(customer_id: str, details: dict) -> dict:
         return {"status": "error", "message": f"Failed to update HubSpot: {str(e)}"}
 
 
-def retrieve_cart_information(customer_id: str) -> dict:
+@cached(ttl=PRICE_TABLE_TTL_SECS, maxsize=1, copy_results=False)
+def _sku_price_table() -> dict:
+    """Fetches the on-demand Compute Engine price list.
+
+    The catalogue has thousands of SKUs and prices rarely change, so the
+    table is shared by every cart lookup in the process for a day. When
+    several SKUs share a key, the one with the lowest skuId wins regardless
+    of API ordering, and conflicting prices are logged.
+
+    Returns:
+        dict: Unit price in USD keyed by (resource group, region, usage unit).
+    """
+    chosen = {}
+    skus = _list_all(
+        _billing_client().services().skus(),
+        items_key='skus',
+        parent=COMPUTE_ENGINE_SERVICE,
+    )
+    for sku in skus:
+        category = sku['category']
+        if category.get('usageType') != 'OnDemand':
+            continue
+        expression = sku['pricingInfo'][0]['pricingExpression']
+        unit_price = expression['tieredRates'][-1]['unitPrice']
+        price = (int(unit_price.get('units', 0))
+                 + unit_price.get('nanos', 0) / 1e9)
+        for region in sku.get('serviceRegions', []):
+            key = (category['resourceGroup'], region, expression['usageUnit'])
+            current = chosen.get(key)
+            if current is None:
+                chosen[key] = (sku['skuId'], sku['description'], price)
+                continue
+            if current[2] != price:
+                logger.warning(
+                    "SKUs %s (%s) and %s (%s) share price key %s with "
+                    "different prices",
+                    current[0], current[1], sku['skuId'],
+                    sku['description'], key)
+            if sku['skuId'] < current[0]:
+                chosen[key] = (sku['skuId'], sku['description'], price)
+    return {key: price for key, (_, _, price) in chosen.items()}
+
+
+def _sku_price(
+        table: dict, resource_group: str, region: str, unit: str) -> float:
+    """Returns a unit price from the table built by _sku_price_table.
+
+    Raises:
+        KeyError: If there is no on-demand SKU for the group in the region.
+    """
+    try:
+        return table[(resource_group, region, unit)]
+    except KeyError:
+        raise KeyError(
+            f"No on-demand {resource_group} SKU billed in {unit} for {region}"
+        ) from None
+
+
+def _machine_hourly_price(
+        table: dict, machine: MachineSpec, region: str) -> float:
+    """Prices a machine type from its family's core and RAM SKUs.
+
+    Args:
+        table: Prices returned by _sku_price_table.
+        machine: The machine type's spec.
+        region: The region the machine runs in, e.g. 'us-central1'.
+
+    Returns:
+        float: The on-demand price per hour in USD.
+    """
+    family = machine.name.split('-', 1)[0]
+    resource_group = MACHINE_RESOURCE_GROUPS.get(family)
+    if resource_group is None:
+        raise KeyError(f"No pricing resource group for {machine.name}")
+    core_price = _sku_price(table, resource_group, region, 'h')
+    ram_price = _sku_price(table, resource_group, region, 'GiBy.h')
+    return machine.cpus * core_price + machine.memory_gb * ram_price
+
+
+def _disk_monthly_price_per_gb(
+        table: dict, disk_type: str, region: str) -> float:
+    """Prices a persistent disk type from its capacity SKU.
+
+    Args:
+        table: Prices returned by _sku_price_table.
+        disk_type: The disk type, e.g. 'pd-ssd'.
+        region: The region the disk is in, e.g. 'us-central1'.
+
+    Returns:
+        float: The price per GB per month in USD.
+    """
+    resource_group = DISK_RESOURCE_GROUPS.get(disk_type)
+    if resource_group is None:
+        raise KeyError(f"No pricing resource group for {disk_type}")
+    return _sku_price(table, resource_group, region, 'GiBy.mo')
+
+
+@cached(ttl=3600)
+async def retrieve_cart_information(customer_id: str, zone: str) -> dict:
     """
     Args:
         customer_id (str): The ID of the customer.
+        zone (str): The zone of the customer's resources, e.g. 'us-central1-a'.
 
     Returns:
         dict: A dictionary representing the cart contents.
 
     Example:
-        >>> retrieve_cart_information(customer_id='123')
+        >>> await retrieve_cart_information(customer_id='123', zone='us-central1-a')
         {'items': [{'product_id': 'n2-standard-2', 'name': 'N2 Standard Instance (2 vCPU)', 'quantity': 1}, {'product_id': 'pd-ssd', 'name': 'Persistent SSD Disk 500GB', 'quantity': 1}], 'subtotal': 125.40}
     """
     logger.info("Accessing cart information for customer ID: %s", customer_id)
 
     try:
         # Initialize Google Cloud clients
-        compute = googleapiclient.discovery.build('compute', 'v1')
-        billing = googleapiclient.discovery.build('cloudbilling', 'v1')
+        compute = _compute_client()
+        region = zone.rsplit('-', 1)[0]
 
         cart_items = []
         cart_subtotal = 0.0
 
-        # Query customer's selected instances
-        zone = ToolContext.get_input("Please enter the zone for resources")
-        request = compute.instances().list(project=configs.GOOGLE_CLOUD_PROJECT, zone=zone)
-        while request is not None:
-            response = request.execute()
-            for instance in response.get('items', []):
-                if instance.get('labels', {}).get('customer_id') == customer_id:
-                    machine_type = instance['machineType'].split('/')[-1]
-
-                    # Get pricing using Cloud Billing API
-                    price_request = billing.services().skus().list(
-                        parent=f'services/6F81-5844-456A',  # Compute Engine service
-                        filter=f'resource.name = {machine_type}'
-                    ).execute()
-
-                    # Calculate instance cost from pricing data
-                    price_per_hour = float(
-                        price_request['skus'][0]['pricingInfo'][0]['pricingExpression']['tieredRates'][0]['unitPrice']['nanos']) / 1e9
-                    monthly_cost = price_per_hour * 730  # Average hours per month
-
-                    cart_items.append({
-                        'product_id': machine_type,
-                        'name': instance['name'],
-                        'quantity': 1,
-                        'monthly_cost': monthly_cost
-                    })
-                    cart_subtotal += monthly_cost
-                request = compute.instances().list_next(
-                    previous_request=request, previous_response=response)
-
-            # Query customer's selected disks
-            request = compute.disks().list(project=configs.GOOGLE_CLOUD_PROJECT, zone=zone)
-        while request is not None:
-            response = request.execute()
-            for disk in response.get('items', []):
-                if disk.get('labels', {}).get('customer_id') == customer_id:
-                    disk_type = disk['type'].split('/')[-1]
-                    size_gb = int(disk['sizeGb'])
-
-                    # Get disk pricing using Cloud Billing API
-                    price_request = billing.services().skus().list(
-                        parent='services/6F81-5844-456A',
-                        filter=f'resource.name = {disk_type}'
-                    ).execute()
-
-                    # Calculate disk cost from pricing data
-                    price_per_gb = float(
-                        price_request['skus'][0]['pricingInfo'][0]['pricingExpression']['tieredRates'][0]['unitPrice']['nanos']) / 1e9
-                    monthly_cost = price_per_gb * size_gb
-
-                    cart_items.append({
-                        'product_id': disk_type,
-                        'name': f"{disk_type} {size_gb}GB",
-                        'quantity': 1,
-                        'monthly_cost': monthly_cost
-                    })
-                    cart_subtotal += monthly_cost
-            request = compute.disks().list_next(
-                previous_request=request, previous_response=response)
+        # Only the customer's resources and the fields we read are returned.
+        label_filter = f'labels.customer_id = "{customer_id}"'
+
+        # The instance and disk listings, the zone's machine types and the
+        # Compute Engine price list are independent, so they are fetched
+        # concurrently.
+        instances, disks, machine_index, price_table = await asyncio.gather(
+            asyncio.to_thread(
+                _list_all,
+                compute.instances(),
+                project=configs.CLOUD_PROJECT,
+                zone=zone,
+                filter=label_filter,
+                maxResults=500,
+                fields='items(name,machineType),nextPageToken',
+            ),
+            asyncio.to_thread(
+                _list_all,
+                compute.disks(),
+                project=configs.CLOUD_PROJECT,
+                zone=zone,
+                filter=label_filter,
+                maxResults=500,
+                fields='items(type,sizeGb),nextPageToken',
+            ),
+            asyncio.to_thread(
+                _machine_index, configs.CLOUD_PROJECT, zone),
+            asyncio.to_thread(_sku_price_table),
+        )
+
+        # Customer's selected instances. Items that cannot be priced (custom
+        # machine types, unmapped families) are listed without a cost.
+        for instance in instances:
+            machine_type = instance['machineType'].split('/')[-1]
+            machine = next(
+                (spec for spec in
+                 machine_index.get(machine_type.rsplit('-', 1)[0], ())
+                 if spec.name == machine_type),
+                None)
+
+            # Calculate instance cost from pricing data
+            try:
+                if machine is None:
+                    raise KeyError(
+                        f"Unknown machine type {machine_type} in {zone}")
+                price_per_hour = _machine_hourly_price(
+                    price_table, machine, region)
+                monthly_cost = price_per_hour * HOURS_PER_MONTH
+            except KeyError as e:
+                logger.warning("Cannot price instance %s: %s",
+                               instance['name'], e)
+                monthly_cost = None
+
+            cart_items.append({
+                'product_id': machine_type,
+                'name': instance['name'],
+                'quantity': 1,
+                'monthly_cost': monthly_cost
+            })
+            if monthly_cost is not None:
+                cart_subtotal += monthly_cost
+
+        # Customer's selected disks
+        for disk in disks:
+            disk_type = disk['type'].split('/')[-1]
+            size_gb = int(disk['sizeGb'])
+
+            # Calculate disk cost from pricing data
+            try:
+                price_per_gb = _disk_monthly_price_per_gb(
+                    price_table, disk_type, region)
+                monthly_cost = price_per_gb * size_gb
+            except KeyError as e:
+                logger.warning("Cannot price %s disk: %s", disk_type, e)
+                monthly_cost = None
+
+            cart_items.append({
+                'product_id': disk_type,
+                'name': f"{disk_type} {size_gb}GB",
+                'quantity': 1,
+                'monthly_cost': monthly_cost
+            })
+            if monthly_cost is not None:
+                cart_subtotal += monthly_cost
 
         return {
             "items": cart_items,
@@ -243,11 +523,58 @@ def retrieve_cart_information(customer_id: str) -> dict:
         raise
 
 
-def get_product_recommendations(customer_id: str) -> dict:
+@lru_cache(maxsize=32)
+def _machine_index(project: str, zone: str) -> dict:
+    """Lists the machine types of a zone once and groups them by family.
+
+    Machine types only change when Google Cloud releases new ones, so the
+    index is kept for the lifetime of the process.
+
+    Args:
+        project: The Google Cloud project ID.
+        zone: The zone to list machine types for.
+
+    Returns:
+        dict: Tuples of MachineSpec keyed by family, e.g. 'n2-standard'.
+    """
+    machine_types = _list_all(
+        _compute_client().machineTypes(),
+        project=project,
+        zone=zone,
+        fields='items(name,guestCpus,memoryMb),nextPageToken',
+    )
+    families = {}
+    for machine in machine_types:
+        family = machine['name'].rsplit('-', 1)[0]
+        families.setdefault(family, []).append(MachineSpec(
+            machine['name'],
+            machine['guestCpus'],
+            machine['memoryMb'] / 1024,
+        ))
+    return {family: tuple(specs) for family, specs in families.items()}
+
+
+@cached(ttl=3600)
+async def get_product_recommendations(
+    customer_id: str,
+    workload_type: str,
+    vcpu_count: int,
+    memory_needed: float,
+    zone: str,
+    storage_gb: int,
+) -> dict:
     """Provides Compute Engine product recommendations based on customer needs.
 
+    All sizing inputs are tool arguments, so the model gathers them from the
+    customer and passes them in one call instead of five separate prompts.
+
     Args:
         customer_id: Customer ID for personalized recommendations.
+        workload_type: Type of workload, 'web-server' or 'data-processing'.
+        vcpu_count: Number of vCPUs needed.
+        memory_needed: Memory needed in GB.
+        zone: Zone to recommend resources in, e.g. 'us-central1-a'.
+        storage_gb: Storage needed in GB.
 
     Returns:
         A dictionary of recommended Compute Engine products.
@@ -258,74 +585,58 @@ def get_product_recommendations(customer_id: str) -> dict:
     )
 
     try:
-        # Get customer needs through ADK interface
-        workload_type = ToolContext.get_input(
-            "What type of workload? (web-server/data-processing)")
-
-        vcpu_count = ToolContext.get_input(
-            "How many vCPUs needed? (enter number)")
-
-        memory_needed = ToolContext.get_input(
-            "How much memory needed in GB? (enter number)")
-
         # Initialize Google Cloud Compute Engine client
-        compute = googleapiclient.discovery.build('compute', 'v1')
-
-        # Get available machine types in the specified zone
-        zone = ToolContext.get_input(
-            "Please enter the zone for recommendations")
-        machine_types_request = compute.machineTypes().list(
-            project=configs.GOOGLE_CLOUD_PROJECT,
-            zone=zone
+        compute = _compute_client()
+
+        # Get available machine and disk types in the specified zone
+        machine_index, disk_types = await asyncio.gather(
+            asyncio.to_thread(
+                _machine_index, configs.CLOUD_PROJECT, zone),
+            asyncio.to_thread(
+                _list_all,
+                compute.diskTypes(),
+                project=configs.CLOUD_PROJECT,
+                zone=zone,
+            ),
         )
 
-        machine_types = machine_types_request.execute()
-
         recommendations = {"recommendations": []}
+        vcpu_count = int(vcpu_count)
+        memory_needed = float(memory_needed)
+        storage_gb = int(storage_gb)
 
         if workload_type.lower() == "web-server":
             # For web servers, recommend balanced instances matching specs
-            for machine in machine_types.get('items', []):
-                if ('n2-standard' in machine['name'] and
-                    machine['guestCpus'] <= int(vcpu_count) * 1.5 and
-                        machine['memoryMb']/1024 <= float(memory_needed) * 1.5):
+            for machine in machine_index.get('n2-standard', ()):
+                if (machine.cpus <= vcpu_count * 1.5 and
+                        machine.memory_gb <= memory_needed * 1.5):
                     recommendations["recommendations"].append({
-                        "product_id": machine['name'],
-                        "name": f"{machine['name']} Instance",
-                        "description": f"General-purpose instance with {machine['guestCpus']} vCPUs and {machine['memoryMb']/1024}GB memory",
+                        "product_id": machine.name,
+                        "name": f"{machine.name} Instance",
+                        "description": f"General-purpose instance with {machine.cpus} vCPUs and {machine.memory_gb}GB memory",
                         "specs": {
-                            "cpus": machine['guestCpus'],
-                            "memory_gb": machine['memoryMb']/1024
+                            "cpus": machine.cpus,
+                            "memory_gb": machine.memory_gb
                         }
                     })
 
         elif workload_type.lower() == "data-processing":
             # For data processing, recommend compute-optimized instances
-            for machine in machine_types.get('items', []):
-                if ('c2-standard' in machine['name'] and
-                    machine['guestCpus'] >= int(vcpu_count) and
-                        machine['memoryMb']/1024 >= float(memory_needed)):
+            for machine in machine_index.get('c2-standard', ()):
+                if (machine.cpus >= vcpu_count and
+                        machine.memory_gb >= memory_needed):
                     recommendations["recommendations"].append({
-                        "product_id": machine['name'],
-                        "name": f"{machine['name']} Instance",
-                        "description": f"Compute-optimized instance with {machine['guestCpus']} vCPUs and {machine['memoryMb']/1024}GB memory",
+                        "product_id": machine.name,
+                        "name": f"{machine.name} Instance",
+                        "description": f"Compute-optimized instance with {machine.cpus} vCPUs and {machine.memory_gb}GB memory",
                         "specs": {
-                            "cpus": machine['guestCpus'],
-                            "memory_gb": machine['memoryMb']/1024
+                            "cpus": machine.cpus,
+                            "memory_gb": machine.memory_gb
                         }
                     })
 
         # Add storage recommendations based on workload
-        disk_types_request = compute.diskTypes().list(
-            project=configs.GOOGLE_CLOUD_PROJECT,
-            zone=zone
-        )
-        disk_types = disk_types_request.execute()
-
-        storage_needed = ToolContext.get_input(
-            "How much storage needed in GB? (enter number)")
-
-        for disk in disk_types.get('items', []):
+        for disk in disk_types:
             if ('pd-ssd' in disk['name'] and workload_type.lower() == "data-processing") or \
                ('pd-standard' in disk['name'] and workload_type.lower() == "web-server"):
                 recommendations["recommendations"].append({
@@ -334,7 +645,7 @@ def get_product_recommendations(customer_id: str) -> dict:
                     "description": f"Storage optimized for {workload_type}",
                     "specs": {
                         "type": "SSD" if "ssd" in disk['name'] else "Standard",
-                        "size_gb": storage_needed
+                        "size_gb": storage_gb
                     }
                 })
 
@@ -345,6 +656,30 @@ def get_product_recommendations(customer_id: str) -> dict:
         raise
 
 
+def _security_body(compute_type: str) -> str:
+    """Joins the base and type-specific security instructions.
+
+    Args:
+        compute_type: The compute engine type, e.g. 'n2-standard'.
+
+    Returns:
+        str: The base instructions followed by the type-specific ones.
+    """
+    instructions = SECURITY_INSTRUCTIONS['base'] + SECURITY_INSTRUCTIONS.get(
+        compute_type.lower(), [])
+    return "\n".join(instructions)
+
+
+# Instruction lists for the known compute engine types, joined once at
+# import. The header is added per call so it keeps the customer's casing.
+_SECURITY_BODIES = {
+    compute_type: _security_body(compute_type)
+    for compute_type in SECURITY_INSTRUCTIONS
+    if compute_type != 'base'
+}
+_SECURITY_BASE_BODY = "\n".join(SECURITY_INSTRUCTIONS['base'])
+
+
 def send_security_instructions(customer_id: str, delivery_method: str = 'email') -> dict:
     """Sends security best practices for specific compute engine type.
 
@@ -353,11 +688,11 @@ def send_security_instructions(customer_id: str, delivery_method: str = 'email')
         delivery_method: 'email' (default) or 'sms'.
 
     Returns:
-        A dictionary indicating the status.
+        A dictionary indicating the status, with the instructions sent.
 
     Example:
         >>> send_security_instructions(customer_id='123')
-        {'status': 'success', 'message': 'Security instructions for N2 instance sent via email.'}
+        {'status': 'success', 'message': 'Security instructions for N2 instance sent via email.', 'instructions': 'Security Best Practices for N2 instance:\n...'}
     """
     logger.info(
         "Sending security instructions to customer: %s via %s",
@@ -369,23 +704,12 @@ def send_security_instructions(customer_id: str, delivery_method: str = 'email')
     compute_type = ToolContext.get_input(
         "What type of compute engine? (n2-standard/c2-standard)")
 
-    # Get instructions from prompts config
-    try:
-
-        base_instructions = SECURITY_INSTRUCTIONS['base']
-        specific_instructions = SECURITY_INSTRUCTIONS.get(
-            compute_type.lower(), [])
-
-        instructions = base_instructions + specific_instructions
-        message = f"Security Best Practices for {compute_type}:\n" + "\n".join(
-            instructions)
-
-    except (ImportError, KeyError) as e:
-        logger.error("Failed to load security instructions: %s", str(e))
-        return {"status": "error", "message": "Failed to load security configuration"}
+    body = _SECURITY_BODIES.get(compute_type.lower(), _SECURITY_BASE_BODY)
+    instructions = f"Security Best Practices for {compute_type}:\n" + body
 
     # Mock sending instructions
     return {
         "status": "success",
-        "message": f"Security instructions for {compute_type} sent via {delivery_method}."
+        "message": f"Security instructions for {compute_type} sent via {delivery_method}.",
+        "instructions": instructions,
     }
@@ -18,7 +18,7 @@ import sys
 
 import vertexai
 from customer_service.agent import root_agent
-from customer_service.config import Config
+from customer_service.config import get_config
 from google.api_core.exceptions import NotFound
 from vertexai import agent_engines
 from vertexai.preview.reasoning_engines import AdkApp
@@ -26,7 +26,7 @@ from vertexai.preview.reasoning_engines import AdkApp
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-configs = Config()
+configs = get_config()
 
 STAGING_BUCKET = f"gs://{configs.CLOUD_PROJECT}-adk-customer-service-staging"
 
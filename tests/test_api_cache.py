@@ -0,0 +1,115 @@
+"""Unit tests for the api_cache tool-result cache."""
+
+import asyncio
+import inspect
+import time
+
+import pytest
+
+from customer_service.shared_libraries.api_cache import cached
+
+pytestmark = pytest.mark.unit
+
+
+def test_sync_results_are_cached():
+    calls = []
+
+    @cached(ttl=60)
+    def lookup(customer_id: str) -> dict:
+        calls.append(customer_id)
+        return {"customer_id": customer_id}
+
+    assert lookup("123") == {"customer_id": "123"}
+    assert lookup("123") == {"customer_id": "123"}
+    assert lookup("456") == {"customer_id": "456"}
+    assert calls == ["123", "456"]
+
+
+def test_async_results_are_cached():
+    calls = []
+
+    @cached(ttl=60)
+    async def lookup(customer_id: str, zone: str) -> dict:
+        calls.append((customer_id, zone))
+        return {"customer_id": customer_id, "zone": zone}
+
+    first = asyncio.run(lookup("123", "us-central1-a"))
+    second = asyncio.run(lookup("123", "us-central1-a"))
+
+    assert first == second == {"customer_id": "123", "zone": "us-central1-a"}
+    assert calls == [("123", "us-central1-a")]
+    assert asyncio.iscoroutinefunction(lookup)
+
+
+def test_positional_keyword_and_default_calls_share_a_key():
+    calls = []
+
+    @cached(ttl=60)
+    def lookup(customer_id: str, zone: str = "us-central1-a") -> dict:
+        calls.append(customer_id)
+        return {"customer_id": customer_id, "zone": zone}
+
+    lookup("123")
+    lookup("123", "us-central1-a")
+    lookup(customer_id="123", zone="us-central1-a")
+    lookup("123", zone="europe-west1-b")
+
+    assert calls == ["123", "123"]
+
+
+def test_results_expire_after_ttl():
+    calls = []
+
+    @cached(ttl=0.05)
+    def lookup(customer_id: str) -> dict:
+        calls.append(customer_id)
+        return {"customer_id": customer_id}
+
+    lookup("123")
+    lookup("123")
+    time.sleep(0.1)
+    lookup("123")
+
+    assert calls == ["123", "123"]
+
+
+def test_mutating_a_result_does_not_corrupt_the_cache():
+
+    @cached(ttl=60)
+    def lookup(customer_id: str) -> dict:
+        return {"items": []}
+
+    lookup("123")["items"].append("x")
+    lookup("123")["items"].append("y")
+
+    assert lookup("123") == {"items": []}
+
+
+def test_cache_clear_forces_a_refetch():
+    calls = []
+
+    @cached(ttl=60)
+    def lookup(customer_id: str) -> dict:
+        calls.append(customer_id)
+        return {"customer_id": customer_id}
+
+    lookup("123")
+    lookup.cache_clear()
+    lookup("123")
+
+    assert calls == ["123", "123"]
+
+
+def test_wrapper_keeps_the_tool_signature():
+
+    @cached(ttl=60)
+    def lookup(customer_id: str, zone: str) -> dict:
+        """Looks up a customer."""
+        return {}
+
+    assert lookup.__name__ == "lookup"
+    assert lookup.__doc__ == "Looks up a customer."
+    assert list(inspect.signature(lookup).parameters) == [
+        "customer_id",
+        "zone",
+    ]
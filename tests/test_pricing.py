@@ -0,0 +1,156 @@
+"""Unit tests for the Compute Engine cart pricing helpers."""
+
+import asyncio
+
+import pytest
+
+from customer_service.tools import tools
+from customer_service.tools.tools import MachineSpec
+
+pytestmark = pytest.mark.unit
+
+
+def _sku(sku_id, group, regions, unit, units=0, nanos=0, usage="OnDemand",
+         description=None):
+    return {
+        "skuId": sku_id,
+        "description": description or f"{group} {unit}",
+        "category": {"resourceGroup": group, "usageType": usage},
+        "serviceRegions": regions,
+        "pricingInfo": [{
+            "pricingExpression": {
+                "usageUnit": unit,
+                "tieredRates": [
+                    {"unitPrice": {"units": str(units), "nanos": nanos}}
+                ],
+            }
+        }],
+    }
+
+
+SKUS = [
+    _sku("A1", "N2Standard", ["us-central1"], "h", nanos=31_000_000),
+    _sku("A2", "N2Standard", ["europe-west1"], "h", nanos=34_000_000),
+    _sku("A3", "N2Standard", ["us-central1"], "h", nanos=7_000_000,
+         usage="Preemptible"),
+    _sku("A4", "N2Standard", ["us-central1", "europe-west1"], "GiBy.h",
+         nanos=4_000_000),
+    _sku("B1", "SSD", ["us-central1"], "GiBy.mo", units=1, nanos=500_000_000),
+]
+
+
+class _FakeBilling:
+
+    def services(self):
+        return self
+
+    def skus(self):
+        return object()
+
+
+@pytest.fixture
+def price_table(monkeypatch):
+    monkeypatch.setattr(tools, "_billing_client", lambda: _FakeBilling())
+    monkeypatch.setattr(tools, "_list_all", lambda collection, **kwargs: SKUS)
+    return tools._sku_price_table.__wrapped__()
+
+
+def test_price_table_adds_units_and_nanos(price_table):
+    assert price_table[("SSD", "us-central1", "GiBy.mo")] == pytest.approx(1.5)
+
+
+def test_price_table_skips_non_on_demand_skus(price_table):
+    assert price_table[("N2Standard", "us-central1", "h")] == pytest.approx(
+        0.031)
+
+
+def test_price_table_keeps_lowest_sku_id_for_duplicate_keys(monkeypatch):
+    skus = [
+        _sku("Z9", "SSD", ["us-central1"], "GiBy.mo", nanos=200_000_000),
+        _sku("C1", "SSD", ["us-central1"], "GiBy.mo", nanos=170_000_000),
+    ]
+    monkeypatch.setattr(tools, "_billing_client", lambda: _FakeBilling())
+    monkeypatch.setattr(tools, "_list_all", lambda collection, **kwargs: skus)
+    table = tools._sku_price_table.__wrapped__()
+    assert table[("SSD", "us-central1", "GiBy.mo")] == pytest.approx(0.17)
+
+    skus.reverse()
+    table = tools._sku_price_table.__wrapped__()
+    assert table[("SSD", "us-central1", "GiBy.mo")] == pytest.approx(0.17)
+
+
+def test_machine_price_sums_core_and_ram(price_table):
+    machine = MachineSpec("n2-standard-2", 2, 8.0)
+    price = tools._machine_hourly_price(price_table, machine, "us-central1")
+    assert price == pytest.approx(2 * 0.031 + 8 * 0.004)
+
+
+def test_machine_price_uses_the_zone_region(price_table):
+    machine = MachineSpec("n2-standard-2", 2, 8.0)
+    price = tools._machine_hourly_price(price_table, machine, "europe-west1")
+    assert price == pytest.approx(2 * 0.034 + 8 * 0.004)
+
+
+def test_machine_price_unknown_region_raises(price_table):
+    machine = MachineSpec("n2-standard-2", 2, 8.0)
+    with pytest.raises(KeyError):
+        tools._machine_hourly_price(price_table, machine, "asia-east1")
+
+
+def test_machine_price_unknown_family_raises(price_table):
+    machine = MachineSpec("t2d-standard-2", 2, 8.0)
+    with pytest.raises(KeyError):
+        tools._machine_hourly_price(price_table, machine, "us-central1")
+
+
+def test_disk_price_per_gb(price_table):
+    price = tools._disk_monthly_price_per_gb(price_table, "pd-ssd",
+                                             "us-central1")
+    assert price == pytest.approx(1.5)
+
+
+def test_disk_price_unknown_type_raises(price_table):
+    with pytest.raises(KeyError):
+        tools._disk_monthly_price_per_gb(price_table, "pd-balanced",
+                                         "us-central1")
+
+
+class _FakeCompute:
+
+    def instances(self):
+        return "instances"
+
+    def disks(self):
+        return "disks"
+
+
+def test_cart_lists_unpriceable_items_without_cost(monkeypatch, price_table):
+    listings = {
+        "instances": [
+            {"name": "web", "machineType": "zones/z/n2-standard-2"},
+            {"name": "custom", "machineType": "zones/z/n2-custom-4-8192"},
+        ],
+        "disks": [
+            {"type": "zones/z/pd-ssd", "sizeGb": "10"},
+            {"type": "zones/z/pd-balanced", "sizeGb": "10"},
+        ],
+    }
+    monkeypatch.setattr(tools, "_compute_client", lambda: _FakeCompute())
+    monkeypatch.setattr(
+        tools, "_list_all", lambda collection, **kwargs: listings[collection])
+    monkeypatch.setattr(
+        tools, "_machine_index",
+        lambda project, zone: {
+            "n2-standard": (MachineSpec("n2-standard-2", 2, 8.0),)
+        })
+    monkeypatch.setattr(tools, "_sku_price_table", lambda: price_table)
+
+    cart = asyncio.run(tools.retrieve_cart_information.__wrapped__(
+        "123", "us-central1-a"))
+
+    costs = {item["name"]: item["monthly_cost"] for item in cart["items"]}
+    assert costs["web"] == pytest.approx((2 * 0.031 + 8 * 0.004) * 730)
+    assert costs["custom"] is None
+    assert costs["pd-ssd 10GB"] == pytest.approx(15.0)
+    assert costs["pd-balanced 10GB"] is None
+    assert cart["subtotal"] == pytest.approx(costs["web"] + 15.0)